@@ -2,15 +2,20 @@
 """
 Debug launcher for serial_gui.py
 Sets a breakpoint at the process_text method
+
+The breakpoint is installed when this file is run as a script, or when it is
+imported with the PYSERIAL_DEBUG environment variable set; a plain import
+leaves AnsiColorizer.process_text untouched.
 """
 
+import os
 import pdb
 import tkinter as tk
 import importlib
 import serial_gui
 import types
 
-# Patch the process_text method to include a breakpoint
+# Keep a reference to the original process_text method
 original_process_text = serial_gui.AnsiColorizer.process_text
 
 def patched_process_text(self, text):
@@ -18,11 +23,16 @@ def patched_process_text(self, text):
     breakpoint()  # Python 3.7+ breakpoint() function
     return original_process_text(self, text)
 
-# Apply the monkey patch
-serial_gui.AnsiColorizer.process_text = patched_process_text
+def install_breakpoint():
+    # Apply the monkey patch
+    serial_gui.AnsiColorizer.process_text = patched_process_text
+
+if os.environ.get('PYSERIAL_DEBUG'):
+    install_breakpoint()
 
 # Start the application
 if __name__ == "__main__":
+    install_breakpoint()
     print("Starting serial_gui in debug mode with breakpoint at process_text()")
     print("When text with ANSI codes is received, the debugger will pause execution")
     print("Use 'n' to step to next line, 'c' to continue, 'q' to quit debugger")
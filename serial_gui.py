@@ -6,94 +6,58 @@ A simple GUI for interfacing with serial ports.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog
+from tkinter import font as tkfont
 import serial
 import serial.tools.list_ports
 import threading
+import queue
 import time
+import collections
+import functools
+import array
+import codecs
 import re
-import datetime
-import binascii
 import sys
 import logging
 
 
 # Configure logging system
 class LogLevel:
-    DEBUG = 10
-    INFO = 20
-    WARNING = 30
-    ERROR = 40
-    CRITICAL = 50
-    NONE = 100  # Special level to disable logging
+    DEBUG = logging.DEBUG
+    INFO = logging.INFO
+    WARNING = logging.WARNING
+    ERROR = logging.ERROR
+    CRITICAL = logging.CRITICAL
+    NONE = logging.CRITICAL + 10  # Special level to disable logging
 
 
-class Logger:
-    """Simple logging utility with different log levels"""
+def _init_logger(level):
+    """Create the application logger, printing to the console"""
+    app_logger = logging.getLogger("PySerialUI")
+    app_logger.setLevel(level)
 
-    def __init__(self, level=LogLevel.INFO):
-        self.level = level
-        self._init_logger()
+    # Create console handler with formatter
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s',
+                                  datefmt='%Y-%m-%d %H:%M:%S')
+    handler.setFormatter(formatter)
+    app_logger.addHandler(handler)
 
-    def _init_logger(self):
-        """Initialize the Python logger"""
-        self.logger = logging.getLogger("PySerialUI")
-        self.logger.setLevel(logging.DEBUG)
+    # Prevent propagation to root logger
+    app_logger.propagate = False
+    return app_logger
 
-        # Create console handler
-        handler = logging.StreamHandler()
-        handler.setLevel(logging.DEBUG)
 
-        # Create formatter
-        formatter = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s',
-                                      datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
+# Create the global logger
+logger = _init_logger(LogLevel.ERROR)
 
-        # Add handler to logger
-        self.logger.addHandler(handler)
-
-        # Prevent propagation to root logger
-        self.logger.propagate = False
-
-    def set_level(self, level):
-        """Set the logging level"""
-        self.level = level
-
-    def debug(self, message):
-        """Log debug message"""
-        if self.level <= LogLevel.DEBUG:
-            self.logger.debug(message)
-
-    def info(self, message):
-        """Log info message"""
-        if self.level <= LogLevel.INFO:
-            self.logger.info(message)
-
-    def warning(self, message):
-        """Log warning message"""
-        if self.level <= LogLevel.WARNING:
-            self.logger.warning(message)
-
-    def error(self, message):
-        """Log error message"""
-        if self.level <= LogLevel.ERROR:
-            self.logger.error(message)
-
-    def critical(self, message):
-        """Log critical message"""
-        if self.level <= LogLevel.CRITICAL:
-            self.logger.critical(message)
-
-
-# Create a global logger instance
-logger = Logger(LogLevel.ERROR)
+# Line terminator appended to sent lines when "Add CR+LF" is checked
+_CRLF = b'\r\n'
 
 
 class AnsiColorizer:
     """Parser for ANSI escape codes to apply formatting to tkinter Text widget"""
 
-    # ANSI escape sequence regex pattern
-    ANSI_PATTERN = re.compile(r'\x1b\[((?:\d+;)*\d+)?([a-zA-Z])')
-
     # Basic ANSI color codes
     COLORS = {
         '30': 'black',
@@ -121,61 +85,189 @@ class AnsiColorizer:
         '4': 'underline',
     }
 
+    # CSI escape sequence: ESC [ <parameter bytes> <intermediate bytes> <final byte>.
+    # The final byte is optional so a sequence cut off at the end of a chunk still matches.
+    CSI_PATTERN = re.compile(r'\x1b\[([0-?]*)[ -/]*([@-~])?')
+
+    # Background color codes (40-47, 100-107)
+    BG_COLORS = {str(int(code) + 10): color for code, color in COLORS.items()}
+
+    # Longest escape sequence held back when a chunk ends in the middle of it
+    MAX_PARTIAL_ESCAPE = 32
+
     def __init__(self, text_widget):
         self.text = text_widget
+        # Tag tuples already built for a (fg, bg, attrs) state
+        self._tags_cache = {}
+        self.reset()
         self.init_tags()
 
+    def reset(self):
+        """Forget the current formatting, e.g. when a new connection starts"""
+        # Current formatting: foreground tag, background tag and attribute bitmask
+        self._fg = None
+        self._bg = None
+        self._attrs = 0
+        # Tags matching the formatting above, rebuilt only when an SGR sequence changes it
+        self._tags = ''
+        # Start of an escape sequence cut off at the end of the previous chunk
+        self._partial = ''
+
+    def discard_partial(self):
+        """Drop an escape sequence held back from the previous chunk, e.g. when the
+        stream continues as something other than text"""
+        self._partial = ''
+
     def init_tags(self):
         """Initialize text widget tags for ANSI colors and attributes"""
         # Define color tags
         for code, color in self.COLORS.items():
             self.text.tag_configure(f"fg_{code}", foreground=color)
-            # Background colors (40-47, 100-107)
-            bg_code = str(int(code) + 10)
-            self.text.tag_configure(f"bg_{bg_code}", background=color)
-
-        # Define attribute tags
-        self.text.tag_configure('bold', font=('TkDefaultFont', 10, 'bold'))
-        self.text.tag_configure('italic', font=('TkDefaultFont', 10, 'italic'))
+        for code, color in self.BG_COLORS.items():
+            self.text.tag_configure(f"bg_{code}", background=color)
+
+        # Define attribute tags; the fonts are created once and shared by reference
+        self._bold_font = tkfont.Font(root=self.text, family='TkDefaultFont', size=10, weight='bold')
+        self._italic_font = tkfont.Font(root=self.text, family='TkDefaultFont', size=10, slant='italic')
+        self.text.tag_configure('bold', font=self._bold_font)
+        self.text.tag_configure('italic', font=self._italic_font)
         self.text.tag_configure('underline', underline=1)
 
         # Reset tag (default formatting)
         self.text.tag_configure('reset', foreground='black', background='white')
 
     def process_text(self, text):
-        """Process text with ANSI escape codes and add to text widget with appropriate styling"""
-        # Split the text by ANSI escape sequences
-        parts = self.ANSI_PATTERN.split(text)
-
-        # Track active tags
-        active_tags = set()
-
-        # Process each part
-        i = 0
-        while i < len(parts):
-            if i % 3 == 0:  # This is regular text
-                if parts[i]:
-                    # Insert text with current active tags
-                    self.text.insert(tk.END, parts[i], tuple(active_tags) if active_tags else '')
-            else:
-                if i % 3 == 1:  # This is the parameter part
-                    if parts[i] and parts[i+1] == 'm':  # 'm' is for SGR (Select Graphic Rendition)
-                        codes = parts[i].split(';')
-                        for code in codes:
-                            if code == '0':  # Reset
-                                active_tags.clear()
-                            elif code in self.COLORS:  # Foreground color
-                                # Remove existing foreground colors
-                                active_tags = {tag for tag in active_tags if not tag.startswith('fg_')}
-                                active_tags.add(f"fg_{code}")
-                            elif code.startswith('4') and code[1:] in self.COLORS:  # Background color
-                                # Remove existing background colors
-                                active_tags = {tag for tag in active_tags if not tag.startswith('bg_')}
-                                active_tags.add(f"bg_{code}")
-                            elif code in self.ATTRIBUTES:  # Text attribute
-                                active_tags.add(self.ATTRIBUTES[code])
-                i += 1  # Skip the command part
-            i += 1
+        """Process text with ANSI escape codes and add to text widget with appropriate styling
+
+        Formatting carries over from one call to the next, so text may be fed
+        in arbitrary chunks as it is received.
+        """
+        if self._partial:
+            text = self._partial + text
+            self._partial = ''
+
+        tags = self._tags
+
+        first_esc = text.find('\x1b[')
+        if first_esc < 0:
+            # Plain text: a single insert with the current formatting, nothing to parse
+            if text.endswith('\x1b'):
+                # May be the start of an escape sequence completed by the next chunk
+                self._partial = '\x1b'
+                text = text[:-1]
+            if text:
+                self.text.insert(tk.END, text, tags)
+            return
+
+        length = len(text)
+        end = length  # End of the text to insert now
+        fg, bg, attrs = self._fg, self._bg, self._attrs
+
+        # Alternating text/tags arguments, inserted with a single Text.insert call
+        runs = []
+        # Text segments sharing the current tags; merged into one run when the tags change
+        pieces = []
+
+        pos = 0  # Start of the text not added to pieces yet
+        # Resume where the fast-path check stopped rather than rescanning the text before it
+        for m in self.CSI_PATTERN.finditer(text, first_esc):
+            esc = m.start()
+            command = m.group(2)
+            if command:
+                if esc > pos:
+                    pieces.append(text[pos:esc])
+                if command == 'm':  # 'm' is for SGR (Select Graphic Rendition)
+                    reset, set_fg, set_bg, set_attrs = self._resolve_sgr(m.group(1))
+                    if reset:
+                        fg = bg = None
+                        attrs = 0
+                    if set_fg:
+                        fg = set_fg
+                    if set_bg:
+                        bg = set_bg
+                    attrs |= set_attrs
+                    new_tags = self._tags_for(fg, bg, attrs)
+                    if new_tags != tags:
+                        if pieces:
+                            runs += (''.join(pieces), tags)
+                            pieces = []
+                        tags = new_tags
+                # Any other command (cursor movement, erase, ...) is skipped
+                pos = m.end()
+            elif m.end() == length and length - esc <= self.MAX_PARTIAL_ESCAPE:
+                # Sequence cut off at the end of the chunk: finish it with the next one
+                self._partial = text[esc:]
+                end = esc
+                break
+            # Otherwise the sequence is malformed: leave it in the text as is
+
+        if end == length and text.endswith('\x1b'):
+            self._partial = '\x1b'
+            end -= 1
+
+        if pos < end:
+            pieces.append(text[pos:end])
+        if pieces:
+            runs += (''.join(pieces), tags)
+
+        if runs:
+            self.text.insert(tk.END, *runs)
+
+        self._fg, self._bg, self._attrs = fg, bg, attrs
+        self._tags = tags
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _resolve_sgr(codes_str):
+        """Resolve an SGR parameter string (e.g. '1;31') into (reset, fg, bg, attrs)
+
+        reset tells whether the state is cleared first, fg and bg are the color
+        tags to switch to (None to keep the current one) and attrs are the
+        attribute bits to add. Streams repeat the same few sequences, so results
+        are memoized (bounded, in case a stream sends endless distinct ones).
+        """
+        reset = False
+        fg = bg = None
+        attrs = 0
+        for code in codes_str.split(';'):
+            kind, value = _SGR_ACTION.get(code, (None, None))
+            if kind == 'reset':
+                reset = True
+                fg = bg = None
+                attrs = 0
+            elif kind == 'fg':
+                fg = value
+            elif kind == 'bg':
+                bg = value
+            elif kind == 'attr':
+                attrs |= value
+
+        return (reset, fg, bg, attrs)
+
+    def _tags_for(self, fg, bg, attrs):
+        """Return the tags to insert text with for a formatting state"""
+        key = (fg, bg, attrs)
+        tags = self._tags_cache.get(key)
+        if tags is None:
+            tags = tuple(tag for tag in (fg, bg) if tag)
+            tags += tuple(name for bit, name in _ATTR_TAGS if attrs & bit)
+            self._tags_cache[key] = tags = tags or ''
+        return tags
+
+
+# SGR code -> (kind, value), built once from the AnsiColorizer tables.
+# Colors map to their tag name, attributes to their bit in the attribute mask.
+_SGR_ACTION = {'0': ('reset', None)}
+for _code in AnsiColorizer.COLORS:
+    _SGR_ACTION[_code] = ('fg', f"fg_{_code}")
+for _code in AnsiColorizer.BG_COLORS:
+    _SGR_ACTION[_code] = ('bg', f"bg_{_code}")
+
+# (bit, tag name) for each attribute in the attribute mask
+_ATTR_TAGS = tuple((1 << _i, _name) for _i, _name in enumerate(AnsiColorizer.ATTRIBUTES.values()))
+for _code, (_bit, _name) in zip(AnsiColorizer.ATTRIBUTES, _ATTR_TAGS):
+    _SGR_ACTION[_code] = ('attr', _bit)
+del _code, _bit, _name
 
 
 class ToolTip:
@@ -259,6 +351,43 @@ class ToolTip:
 
 
 class SerialGUI:
+    # Delay (ms) between the first chunk of received data and the display update
+    # that shows it together with everything received meanwhile (~60 Hz)
+    RX_POLL_MS = 16
+    # Largest read issued by the reader thread; a read returns early when the port timeout expires
+    RX_READ_SIZE = 4096
+    # Maximum number of received bytes buffered between two display updates;
+    # the oldest chunks are dropped if the display falls behind
+    RX_BUFFER_BYTES = 1024 * 1024
+    # Default number of lines kept in the output window; older lines are discarded
+    MAX_OUTPUT_LINES = 5000
+    # Files larger than this (characters) are loaded into the file view in chunks of
+    # FILE_INSERT_CHUNK, letting the UI handle events in between
+    FILE_CHUNKED_LOAD = 1000000
+    FILE_INSERT_CHUNK = 64 * 1024
+    # Data is written to the port in pieces of this size (bytes) by the sender thread,
+    # which reports the progress of larger sends in between
+    TX_WRITE_CHUNK = 4096
+    # A port scan younger than this (seconds) is reused when refreshing the port list
+    PORT_SCAN_TTL = 1.0
+    # Delay (ms) after a window resize before the labels are rewrapped; a resize in
+    # progress keeps sending events, which are handled together by one update
+    WRAP_UPDATE_MS = 50
+
+    # Characters accepted in hex input
+    HEX_INPUT_CHARS = frozenset('0123456789abcdefABCDEF ')
+
+    # Empty or whitespace-only line, including its newline if it has one
+    BLANK_LINE_PATTERN = re.compile(r'^[^\S\n]*(?:\n|\Z)', re.MULTILINE)
+
+    # Keys that still work in the (read-only) file view: moving around and selecting
+    # (ISO_Left_Tab is Shift+Tab on X11, which moves the focus)
+    FILE_VIEW_KEYS = frozenset(('Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End',
+                                'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'ISO_Left_Tab'))
+    # Keys (lowercase) that still work in the file view together with Control (Command
+    # on macOS): copy and select all
+    FILE_VIEW_CONTROL_KEYS = frozenset(('c', 'a', 'slash', 'insert'))
+
     def __init__(self, root):
         self.root = root
         self.root.title("Serial Interface GUI")
@@ -268,6 +397,29 @@ class SerialGUI:
         self.serial_port = None
         self.is_reading = False
         self.read_thread = None
+        # Data waiting to be written by the sender thread: (port, data, done message, error prefix)
+        self._tx_queue = queue.Queue()
+        self._tx_thread = None
+        # The loaded file encoded as UTF-8, and the offset of each line's start in it
+        # (followed by one past the end of the text)
+        self._file_blob = None
+        self._line_starts = None
+        self._port_fd = None  # Descriptor watched by the Tk event loop, if any
+        self.max_output_lines = self.MAX_OUTPUT_LINES
+        self._port_scan = None  # (time.monotonic(), ports) of the last port scan
+        self._file_load_id = None  # Pending chunk of a large file being loaded
+        self._highlight_line = None  # Line number currently highlighted in the file view
+        self._wrap_pending = None  # Pending label wraplength update after a resize
+        self._label_wraplength = None  # wraplength last set on the file pane labels
+
+        # Received data waiting for the next display update
+        self._rx_buf = collections.deque()
+        self._rx_buf_bytes = 0
+        self._rx_lock = threading.Lock()
+        self._drain_scheduled = False  # A display update is pending (guarded by _rx_lock)
+        self._drain_id = None
+        # Keeps multi-byte UTF-8 sequences split across reads together
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
 
         # Calculate initial dimensions
         self.initial_width = 1000
@@ -276,6 +428,11 @@ class SerialGUI:
         self.create_widgets()
         self.refresh_ports()
 
+        # Writes block until the data is out, which takes a while on a slow link: they
+        # are done by a sender thread, in the order they were requested
+        self._tx_thread = threading.Thread(target=self._tx_worker, daemon=True)
+        self._tx_thread.start()
+
     def _set_combobox_width(self, combobox, extra_width=0):
         """Set the width of a combobox based on the longest item in its list"""
         values = combobox['values']
@@ -283,11 +440,17 @@ class SerialGUI:
             return
 
         # Find the longest item
-        max_length = max(len(str(item)) for item in values)
+        max_length = self._max_item_length(tuple(values))
 
         # Add a small buffer for visual comfort and extra_width for specific adjustments
         combobox.config(width=max_length + 1 + extra_width)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _max_item_length(values):
+        """Length of the longest item in a tuple of combobox values"""
+        return max(len(str(item)) for item in values)
+
     def create_widgets(self):
         # Create frame for controls
         control_frame = ttk.LabelFrame(self.root, text="Connection Settings")
@@ -358,6 +521,15 @@ class SerialGUI:
         self.hexview_cb = ttk.Checkbutton(options_frame, text="Hex Display", variable=self.hexview_var)
         self.hexview_cb.pack(side=tk.LEFT, padx=5)
 
+        # Number of lines kept in the output window
+        ttk.Label(options_frame, text="Max Lines:").pack(side=tk.LEFT, padx=(15, 2))
+        self.max_lines_spin = ttk.Spinbox(options_frame, from_=100, to=1000000, increment=1000, width=8,
+                                          command=self.set_max_output_lines)
+        self.max_lines_spin.set(self.max_output_lines)
+        self.max_lines_spin.pack(side=tk.LEFT)
+        self.max_lines_spin.bind("<Return>", self.set_max_output_lines)
+        self.max_lines_spin.bind("<FocusOut>", self.set_max_output_lines)
+
         # Create a scrolled text widget for output display
         self.output_text = scrolledtext.ScrolledText(display_frame, wrap=tk.WORD, width=60, height=15)
         self.output_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -376,6 +548,9 @@ class SerialGUI:
 
         # Add checkbox for newline option
         self.newline_var = tk.BooleanVar(value=True)
+        # Follow the option in _crlf_suffix rather than reading the variable on every send
+        self.newline_var.trace_add('write', self._update_crlf_suffix)
+        self._update_crlf_suffix()
         self.newline_cb = ttk.Checkbutton(input_frame, text="Add CR+LF", variable=self.newline_var)
         self.newline_cb.pack(side=tk.RIGHT, padx=2)
 
@@ -417,6 +592,21 @@ class SerialGUI:
         # Scrolled text for file content - width will be automatically adjusted based on PanedWindow
         self.file_content_text = scrolledtext.ScrolledText(file_content_frame, wrap=tk.WORD, height=10)
         self.file_content_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.file_content_text.tag_configure("highlight", background="lightblue")  # Style of the clicked line
+        # Moves the highlight to the line from s to e, off the one given by the optional
+        # remaining arguments: one call into Tcl instead of two per click
+        self.root.tk.eval('proc py_highlight {w s e args} {'
+                          ' if {[llength $args]} { $w tag remove highlight {*}$args };'
+                          ' $w tag add highlight $s $e }')
+        # The file view is read-only: rather than switching its state off and on around
+        # every change, keys and events that would edit it are ignored
+        self.file_content_text.bind("<Key>", self._ignore_file_edit_key)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.file_content_text.bind(sequence, lambda event: "break")
+        # Tab moves the focus on, as it did while the view was disabled, instead of inserting
+        self.file_content_text.bind("<Tab>", self._focus_next_widget)
+        self.file_content_text.bind("<Shift-Tab>", self._focus_prev_widget)
+        self.file_content_text.bind("<<PrevWindow>>", self._focus_prev_widget)
         self.file_content_text.bind("<Button-1>", self.highlight_line)  # Bind single-click to highlight
         self.file_content_text.bind("<Double-Button-1>", self.send_current_line)  # Bind double-click event
         self.file_content_text.bind("<Control-s>", self.send_file_content)  # Bind Ctrl+S to send entire file
@@ -450,17 +640,21 @@ class SerialGUI:
 
     def refresh_ports(self):
         """Refresh the list of available serial ports"""
-        ports = [port.device for port in serial.tools.list_ports.comports()]
+        # Scanning for ports is slow on some platforms; reuse a very recent scan
+        now = time.monotonic()
+        if self._port_scan is None or now - self._port_scan[0] >= self.PORT_SCAN_TTL:
+            self._port_scan = (now, tuple(port.device for port in serial.tools.list_ports.comports()))
+        ports = self._port_scan[1]
         self.port_combo['values'] = ports
 
         # Set the width based on the longest port name, with a minimum of 10 characters
         # and maximum of 15 characters to prevent overly wide combobox
         if ports:
-            max_length = min(max(len(port) for port in ports), 15)
+            max_length = min(self._max_item_length(ports), 15)
             self.port_combo.config(width=max(max_length, 10))
             self.port_combo.current(0)
             # Update port tooltip with current selection
-            self.port_tooltip.text = self.port_combo.get()
+            self.update_port_tooltip()
         else:
             self.port_combo.config(width=10)  # Default width if no ports
             self.status_var.set("No serial ports found")
@@ -468,8 +662,9 @@ class SerialGUI:
     def update_port_tooltip(self, event=None):
         """Update the tooltip for the port combo box with the current selection"""
         current_port = self.port_combo.get()
-        if current_port:
-            self.port_tooltip.text = current_por
+        # The tooltip also updates itself on selection, so compare with what it shows
+        if current_port and current_port != self.port_tooltip.text:
+            self.port_tooltip.text = current_port
 
     def set_log_level(self, event=None):
         """Set the logging level based on the selected value"""
@@ -483,8 +678,8 @@ class SerialGUI:
             "None": LogLevel.NONE
         }
         level = level_map.get(level_str, LogLevel.INFO)
-        logger.set_level(level)
-        logger.info(f"Log level set to {level_str}")
+        logger.setLevel(level)
+        logger.info("Log level set to %s", level_str)
 
     def open_connection(self):
         """Open the selected serial connection"""
@@ -496,9 +691,10 @@ class SerialGUI:
 
         try:
             baud_rate = int(self.baud_combo.get())
-            self.serial_port = serial.Serial(port, baud_rate, timeout=1)
+            # A short read timeout lets a reader thread notice a disconnect request quickly
+            self.serial_port = serial.Serial(port, baud_rate, timeout=0.05)
             self.status_var.set(f"Connected to {port} at {baud_rate} baud")
-            logger.info(f"Connected to {port} at {baud_rate} baud")
+            logger.info("Connected to %s at %d baud", port, baud_rate)
 
             # Update button states
             self.connect_btn.config(state=tk.DISABLED)
@@ -506,24 +702,51 @@ class SerialGUI:
             self.input_text.config(state=tk.NORMAL)
             self.send_btn.config(state=tk.NORMAL)
 
-            # Start reading from the por
+            # Start reading from the port: where Tk can watch file descriptors (POSIX)
+            # the main loop reads it when data arrives, otherwise a reader thread does
             self.is_reading = True
-            self.read_thread = threading.Thread(target=self.read_serial, daemon=True)
-            self.read_thread.start()
+            if hasattr(self.root.tk, 'createfilehandler') and hasattr(self.serial_port, 'fileno'):
+                self._port_fd = self.serial_port.fileno()
+                self.root.tk.createfilehandler(self._port_fd, tk.READABLE, self._on_serial_readable)
+            else:
+                self.read_thread = threading.Thread(target=self.read_serial, daemon=True)
+                self.read_thread.start()
 
         except ValueError:
             self.status_var.set("Error: Invalid baud rate")
             logger.error("Invalid baud rate")
         except serial.SerialException:
             self.status_var.set(f"Error: Could not open port {port}")
-            logger.error(f"Could not open port {port}")
+            logger.error("Could not open port %s", port)
 
     def close_connection(self):
         """Close the serial connection"""
         if self.serial_port and self.serial_port.is_open:
             self.is_reading = False
+            if self._port_fd is not None:
+                self.root.tk.deletefilehandler(self._port_fd)
+                self._port_fd = None
             if self.read_thread:
+                # Wake the reader from its blocking read rather than waiting for the timeout
+                if hasattr(self.serial_port, 'cancel_read'):
+                    self.serial_port.cancel_read()
                 self.read_thread.join(timeout=1.0)
+                self.read_thread = None
+
+            # Cancel the pending display update and show whatever is still buffered
+            if self._drain_id:
+                self.root.after_cancel(self._drain_id)
+                self._drain_id = None
+            self._drain_rx()
+            self._decoder.reset()
+            self.ansi_colorizer.reset()
+
+            # Drop data that hasn't been sent yet
+            try:
+                while True:
+                    self._tx_queue.get_nowait()
+            except queue.Empty:
+                pass
 
             self.serial_port.close()
             self.serial_port = None
@@ -538,87 +761,190 @@ class SerialGUI:
             logger.info("Disconnected from serial port")
 
     def read_serial(self):
-        """Read data from the serial port in a separate thread"""
-        while self.is_reading and self.serial_port and self.serial_port.is_open:
+        """Read data from the serial port in a separate thread (where Tk can't watch the port)"""
+        port = self.serial_port
+        read = port.read
+        read_size = self.RX_READ_SIZE
+        queue_rx = self._queue_rx
+        while self.is_reading and port.is_open:
             try:
-                if self.serial_port.in_waiting > 0:
-                    data = self.serial_port.read(self.serial_port.in_waiting)
-                    if data:
-                        # Debug log received data with escape characters in readable form
-                        debug_str = repr(data.decode('utf-8', errors='replace'))
-                        logger.debug(f"Serial received: {debug_str}")
-
-                        self.display_data(data)
-            except serial.SerialException:
+                # Blocks until RX_READ_SIZE bytes arrived or the timeout expired, so a
+                # burst comes back as one chunk; then pick up anything still waiting
+                data = read(read_size)
+                waiting = port.in_waiting
+                if waiting:
+                    data += read(waiting)
+                if data:
+                    queue_rx(data)
+            except OSError:  # Includes serial.SerialException
                 logger.error("Serial port disconnected unexpectedly")
                 self.root.after(0, self.handle_disconnect)
                 break
-            time.sleep(0.1)
+
+    def _on_serial_readable(self, fd, mask):
+        """Read data from the serial port when it becomes readable (Tk file handler, main thread)"""
+        # An exception escaping a file handler isn't just reported like in other Tk
+        # callbacks: it is raised out of mainloop() and ends the application
+        try:
+            try:
+                # Readable with nothing waiting means the device went away; read() raises
+                # then, or in_waiting does with a plain OSError (e.g. EIO after a hangup)
+                data = self.serial_port.read(self.serial_port.in_waiting or 1)
+            except OSError:  # Includes serial.SerialException
+                logger.error("Serial port disconnected unexpectedly")
+                self.handle_disconnect()
+                return
+            if data:
+                self._queue_rx(data)
+        except Exception as e:
+            logger.error("Error reading serial port: %s", e)
+
+    def _queue_rx(self, data):
+        """Queue received data for the next display update"""
+        if logger.isEnabledFor(logging.DEBUG):
+            # Debug log received data with escape characters in readable form
+            logger.debug("Serial received: %r", data.decode('utf-8', errors='replace'))
+
+        with self._rx_lock:
+            self._rx_buf.append(data)
+            self._rx_buf_bytes += len(data)
+            while self._rx_buf_bytes > self.RX_BUFFER_BYTES and len(self._rx_buf) > 1:
+                self._rx_buf_bytes -= len(self._rx_buf.popleft())
+            schedule = not self._drain_scheduled
+            self._drain_scheduled = True
+
+        # Only the first chunk since the last update schedules one; scheduled
+        # outside the lock since after() may wait for the main thread
+        if schedule:
+            self._drain_id = self.root.after(self.RX_POLL_MS, self._drain_rx)
+
+    def _drain_rx(self):
+        """Display all data received since the last update (called from the main thread)"""
+        with self._rx_lock:
+            chunks = self._rx_buf
+            self._rx_buf = collections.deque()
+            self._rx_buf_bytes = 0
+            self._drain_scheduled = False
+        self._drain_id = None
+
+        if chunks:
+            self.display_data(b''.join(chunks))
 
     def display_data(self, data):
         """Display received data in the text widget"""
         try:
+            # Read the display options once per update
+            show_timestamp = self.timestamp_var.get()
+            show_hex = self.hexview_var.get()
+
             # Get current timestamp if enabled
             timestamp = ""
-            if self.timestamp_var.get():
-                now = datetime.datetime.now()
-                timestamp = f"[{now.strftime('%H:%M:%S.%f')[:-3]}] "
+            if show_timestamp:
+                now = time.time()
+                timestamp = f"[{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1000):03d}] "
 
             # Handle hex display if enabled
-            if self.hexview_var.get():
-                # Format as hex
-                hex_data = binascii.hexlify(data).decode('ascii')
-                # Format hex in pairs with spaces
-                formatted_hex = ' '.join(hex_data[i:i+2] for i in range(0, len(hex_data), 2))
+            if show_hex:
+                # Format as hex pairs separated by spaces
+                formatted_hex = data.hex(' ')
                 display_text = timestamp + formatted_hex
-                self.root.after(0, self._update_display, display_text)
+                # Hex text never contains escape sequences: skip the ANSI colorizer
+                self._update_display(display_text, colorize=False)
+                # Don't glue bytes shown as hex onto a later partial character
+                # or escape sequence
+                self._decoder.reset()
+                self.ansi_colorizer.discard_partial()
             else:
-                # Normal text display
-                text = data.decode('utf-8', errors='replace')
-
-                # Remove carriage returns (\r) from the text before processing
-                text = text.replace('\r', '')
-
-                # Process text by preserving exact newline positions
-                # but still handling timestamps and empty line filtering
-                if timestamp:
-                    # Split strictly at newline characters to preserve line structure
-                    lines = text.split('\n')
-                    result = []
-                    for i, line in enumerate(lines):
-                        # Skip empty lines
-                        if line.strip():
-                            # Add a newline after each line except the last one
-                            if i < len(lines) - 1:
-                                result.append(timestamp + line + '\n')
-                            else:
-                                result.append(timestamp + line)
-                    text = ''.join(result)
-                else:
-                    # If no timestamp, filter empty lines while preserving line structure
-                    lines = text.split('\n')
-                    result = []
-                    for i, line in enumerate(lines):
-                        if line.strip():
-                            # Add a newline after each line except the last one
-                            if i < len(lines) - 1:
-                                result.append(line + '\n')
-                            else:
-                                result.append(line)
-                    text = ''.join(result)
-
-                self.root.after(0, self._update_display, text)
+                # Normal text display; an incomplete trailing character is
+                # held back until the rest of it arrives
+                text = self._decoder.decode(data)
+
+                # Remove carriage returns (\r), then drop empty (or whitespace-only)
+                # lines along with their newline, preserving the line structure
+                text = self.BLANK_LINE_PATTERN.sub('', text.replace('\r', ''))
+
+                if timestamp and text:
+                    # Prefix every remaining line with the timestamp; only the empty
+                    # "line" after a trailing newline must not get one
+                    text = timestamp + text.replace('\n', '\n' + timestamp)
+                    if text.endswith('\n' + timestamp):
+                        text = text[:-len(timestamp)]
+
+                self._update_display(text)
         except Exception as e:
-            self.root.after(0, self._update_display, f"[Error displaying data: {e}]")
+            self._update_display(f"[Error displaying data: {e}]")
 
-    def _update_display(self, text):
+    def _update_display(self, text, colorize=True):
         """Update the display text (called from the main thread)"""
-        self.output_text.config(state=tk.NORMAL)
-        self.ansi_colorizer.process_text(text)
+        output = self.output_text
+        output.config(state=tk.NORMAL)
+        if colorize:
+            self.ansi_colorizer.process_text(text)
+        else:
+            output.insert(tk.END, text)
+        self._trim_output()
         # Auto-scroll to end
-        self.output_text.see(tk.END)
+        output.see(tk.END)
+        output.config(state=tk.DISABLED)
+
+    def _trim_output(self):
+        """Discard the oldest output lines so the widget (and the cost of updating it) stays bounded"""
+        # Deleting the text removes its tags too, so no tag_remove is needed
+        max_lines = self.max_output_lines
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > max_lines:
+            self.output_text.delete('1.0', f"{line_count - max_lines + 1}.0")
+
+    def set_max_output_lines(self, event=None):
+        """Set the number of lines kept in the output window from the Max Lines box"""
+        try:
+            max_lines = int(self.max_lines_spin.get())
+        except ValueError:
+            max_lines = 0
+        if max_lines < 1:
+            self.status_var.set("Error: Max lines must be a positive number")
+            self.max_lines_spin.set(self.max_output_lines)
+            return
+
+        self.max_output_lines = max_lines
+        logger.info("Max output lines set to %d", max_lines)
+        self.output_text.config(state=tk.NORMAL)
+        self._trim_output()
         self.output_text.config(state=tk.DISABLED)
 
+    def _queue_tx(self, data, done_msg=None, error_prefix="Error sending data"):
+        """Queue data for the sender thread to write to the serial port"""
+        self._tx_queue.put((self.serial_port, data, done_msg, error_prefix))
+
+    def _tx_worker(self):
+        """Write queued data to the serial port (runs in a separate thread)"""
+        tx_queue = self._tx_queue
+        chunk = self.TX_WRITE_CHUNK
+        after = self.root.after
+        set_status = self.status_var.set
+        while True:
+            port, data, done_msg, error_prefix = tx_queue.get()
+            total = len(data)
+            try:
+                # Slices of a memoryview share the data instead of copying it
+                view = memoryview(data)
+                for pos in range(0, total, chunk):
+                    port.write(view[pos:pos + chunk])
+                    if total > chunk:
+                        after(0, set_status, f"Sending: {min(pos + chunk, total)}/{total} bytes")
+                if done_msg:
+                    after(0, set_status, done_msg)
+            except Exception as e:
+                if not port.is_open:
+                    continue  # Disconnected meanwhile, which is reported already
+                error_msg = f"{error_prefix}: {str(e)}"
+                logger.error(error_msg)
+                after(0, set_status, error_msg)
+
+    def _update_crlf_suffix(self, *args):
+        """Set the bytes appended to sent lines from the "Add CR+LF" option"""
+        self._crlf_suffix = _CRLF if self.newline_var.get() else b''
+
     def handle_disconnect(self):
         """Handle unexpected disconnection"""
         self.status_var.set("Error: Serial port disconnected unexpectedly")
@@ -636,43 +962,37 @@ class SerialGUI:
                 if self.hexinput_var.get():
                     # Process hex string (remove spaces, validate, convert to bytes)
                     hex_text = input_text.replace(' ', '')
-                    # Validate hex string (must be even length and valid hex chars)
                     if len(hex_text) % 2 != 0:
                         self.status_var.set("Error: Hex string must have an even number of characters")
                         logger.error("Invalid hex string (odd length)")
                         return
-
-                    # Check if string contains only valid hex characters
-                    if not all(c in '0123456789ABCDEFabcdef' for c in hex_text):
-                        self.status_var.set("Error: Invalid hex characters")
-                        logger.error("Invalid hex characters in input")
+                    try:
+                        data = bytes.fromhex(hex_text)
+                    except ValueError as e:
+                        # fromhex counts positions without the spaces: point at the
+                        # invalid character in the input as typed instead
+                        error_msg = f"Invalid hex input: {e}"
+                        for pos, char in enumerate(input_text):
+                            if char not in self.HEX_INPUT_CHARS:
+                                error_msg = f"Invalid hex character {char!r} at position {pos}"
+                                break
+                        self.status_var.set(f"Error: {error_msg}")
+                        logger.error(error_msg)
                         return
-
-                    # Convert hex to bytes
-                    data = binascii.unhexlify(hex_text)
-                    logger.debug(f"Sending hex data: {hex_text}")
+                    logger.debug("Sending hex data: %s", hex_text)
                 else:
                     # Regular text mode
-                    data = input_text
                     # Add newline if option is selected
-                    if self.newline_var.get():
-                        data += '\r\n'
-                    data = data.encode('utf-8')
+                    data = input_text.encode('utf-8') + self._crlf_suffix
 
                 # Send data
-                self.serial_port.write(data)
-                logger.debug(f"Serial sent: {repr(data)}")
+                self._queue_tx(data)
+                logger.debug("Serial sent: %r", data)
                 self.input_text.delete(0, tk.END)
 
             except Exception as e:
                 self.status_var.set(f"Error sending data: {str(e)}")
-                logger.error(f"Error sending data: {str(e)}")
-
-    def update_port_tooltip(self, event=None):
-        """Update the tooltip for the port combo box with the current selection"""
-        current_port = self.port_combo.get()
-        if current_port:
-            self.port_tooltip.text = current_port
+                logger.error("Error sending data: %s", e)
 
     def open_text_file(self):
         """Open a text file dialog and display the content in the text box"""
@@ -691,118 +1011,158 @@ class SerialGUI:
             # Update file path display
             self.file_path_var.set(file_path)
 
-            # Read and display file content with utf-8 encoding
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                content = file.read()
-
-                # Clear the text box and insert new conten
-                self.file_content_text.config(state=tk.NORMAL)  # Temporarily enable editing
-                self.file_content_text.delete(1.0, tk.END)
-                # Make sure to remove any existing highlight tags as well
-                self.file_content_text.tag_remove("highlight", "1.0", tk.END)
-                self.file_content_text.insert(tk.END, content)
-                self.file_content_text.config(state=tk.DISABLED)  # Set to read-only
+            # Read the file as bytes and decode it in one go with utf-8 encoding,
+            # translating line endings like text mode does
+            with open(file_path, 'rb') as file:
+                raw = file.read()
+            content = raw.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+
+            # Encode the file once up front so sending a line needs neither a widget
+            # lookup nor an encode; lines end at '\n' like in the Text widget ('\n' never
+            # occurs inside a multi-byte UTF-8 sequence, so the lines of the bytes are
+            # the lines of the text)
+            self._file_blob = blob = content.encode('utf-8')
+            self._line_starts = line_starts = array.array('q', [0])
+            find = blob.find
+            pos = find(b'\n')
+            while pos >= 0:
+                line_starts.append(pos + 1)
+                pos = find(b'\n', pos + 1)
+            line_starts.append(len(blob) + 1)  # Where a line after the last one would start
+
+            # Clear the text box and insert new content
+            self._cancel_file_load()
+            # Deleting the text removes the highlight tag with it
+            self.file_content_text.delete(1.0, tk.END)
+            self._highlight_line = None
+            if len(content) > self.FILE_CHUNKED_LOAD:
+                # Large file: insert it piece by piece so the UI stays responsive
+                self._insert_file_chunk(content, 0)
+            else:
+                self._insert_file_chunk(content, 0, len(content))
 
-            logger.info(f"Opened file: {file_path}")
+            logger.info("Opened file: %s", file_path)
             self.status_var.set(f"File opened: {file_path}")
 
         except Exception as e:
             error_msg = f"Error opening file: {str(e)}"
-            self.file_content_text.config(state=tk.NORMAL)  # Temporarily enable editing
+            self._cancel_file_load()
+            self._file_blob = self._line_starts = None
+            self._highlight_line = None
             self.file_content_text.delete(1.0, tk.END)
             self.file_content_text.insert(tk.END, error_msg)
-            self.file_content_text.config(state=tk.DISABLED)  # Set to read-only
             self.status_var.set(error_msg)
             logger.error(error_msg)
 
+    def _insert_file_chunk(self, content, pos, size=None):
+        """Append the next chunk of a file to the file view, scheduling the rest when idle"""
+        end = pos + (size or self.FILE_INSERT_CHUNK)
+        self.file_content_text.insert(tk.END, content[pos:end])
+
+        if end < len(content):
+            self._file_load_id = self.root.after_idle(self._insert_file_chunk, content, end)
+        else:
+            self._file_load_id = None
+            self.file_content_text.mark_set(tk.INSERT, "1.0")
+
+    def _cancel_file_load(self):
+        """Stop loading the rest of a large file"""
+        if self._file_load_id:
+            self.root.after_cancel(self._file_load_id)
+            self._file_load_id = None
+
     def send_file_content(self, event=None):
         """Send the content of the file text box to the serial port"""
         if not self.serial_port or not self.serial_port.is_open:
             self.status_var.set("Error: Not connected to any serial port")
             return
 
-        content = self.file_content_text.get(1.0, tk.END)
-        if not content.strip():
+        blob = self._file_blob
+        if blob is None:
+            # Not a loaded file (e.g. an error message): encode the text shown instead
+            blob = self.file_content_text.get(1.0, 'end-1c').encode('utf-8')
+        # Sent as a single write, ending with the newline Tk ends the text with
+        data = blob + b'\n'
+        if not data.strip():
             self.status_var.set("Error: No content to send")
             return
 
-        try:
-            # Send content to serial port
-            data = content.encode('utf-8')
-            self.serial_port.write(data)
-            logger.info(f"Sent file content to serial port: {len(data)} bytes")
-            self.status_var.set(f"File content sent: {len(data)} bytes")
-        except Exception as e:
-            error_msg = f"Error sending file content: {str(e)}"
-            self.status_var.set(error_msg)
-            logger.error(error_msg)
-
-    def update_port_tooltip(self, event=None):
-        """Update the tooltip for the port combo box with the current selection"""
-        current_port = self.port_combo.get()
-        if current_port:
-            self.port_tooltip.text = current_port
+        self._queue_tx(data, f"File content sent: {len(data)} bytes", "Error sending file content")
+        logger.info("Sending file content to serial port: %d bytes", len(data))
 
     def clear_file_content(self):
         """Clear the file content text box"""
-        self.file_content_text.config(state=tk.NORMAL)  # Temporarily enable editing
+        self._cancel_file_load()
+        # Deleting the text removes the highlight tag with it
         self.file_content_text.delete(1.0, tk.END)
-        # Make sure to remove any existing highlight tags as well
-        self.file_content_text.tag_remove("highlight", "1.0", tk.END)
-        self.file_content_text.config(state=tk.DISABLED)  # Set back to read-only
+        self._highlight_line = None
+        self._file_blob = self._line_starts = None
         self.file_path_var.set("No file selected")
         logger.info("File content cleared")
 
     def _update_wraplength(self, event=None):
-        """Update wraplength of labels based on the current window size"""
+        """Schedule a wraplength update of the labels after the window size changed"""
         # Only respond to window size changes, not all configure events
-        if event and event.widget == self.root:
-            # Get the current width of the file operations pane
-            sash_pos = self.main_paned_window.sash_coord(0)[0]
-            window_width = self.root.winfo_width()
-            file_pane_width = window_width - sash_pos - 20  # Some padding
-
-            # Update wraplength for our labels
-            if hasattr(self, 'file_path_label'):
-                self.file_path_label.config(wraplength=max(100, file_pane_width - 20))
-            if hasattr(self, 'instruction_label'):
-                self.instruction_label.config(wraplength=max(100, file_pane_width - 20))
+        if event and event.widget == self.root and not self._wrap_pending:
+            self._wrap_pending = self.root.after(self.WRAP_UPDATE_MS, self._do_update_wraplength)
+
+    def _do_update_wraplength(self):
+        """Update wraplength of labels based on the current window size"""
+        self._wrap_pending = None
+
+        # Get the current width of the file operations pane
+        sash_pos = self.main_paned_window.sash_coord(0)[0]
+        window_width = self.root.winfo_width()
+        file_pane_width = window_width - sash_pos - 20  # Some padding
+        wraplength = max(100, file_pane_width - 20)
+        if wraplength == self._label_wraplength:
+            return  # Pane width unchanged
+        self._label_wraplength = wraplength
+
+        # Update wraplength for our labels
+        if hasattr(self, 'file_path_label'):
+            self.file_path_label.config(wraplength=wraplength)
+        if hasattr(self, 'instruction_label'):
+            self.instruction_label.config(wraplength=wraplength)
 
     def send_current_line(self, event=None):
         """Send the current line (where cursor is) to the serial port"""
-        if not self.serial_port or not self.serial_port.is_open:
+        port = self.serial_port
+        if not port or not port.is_open:
             self.status_var.set("Error: Not connected to any serial port")
             return
 
+        text = self.file_content_text
         try:
             # Get the current line based on cursor position
-            index = self.file_content_text.index(f"@{event.x},{event.y}")
-            line_start = self.file_content_text.index(f"{index} linestart")
-            line_end = self.file_content_text.index(f"{index} lineend")
-            line_content = self.file_content_text.get(line_start, line_end)
+            line = int(text.index(f"@{event.x},{event.y}").split('.', 1)[0])
+            line_start = f"{line}.0"
+            line_end = f"{line}.end"
+            line_starts = self._line_starts
+            if line_starts is not None and line < len(line_starts):
+                # Line of the loaded file: already encoded, sliced out without a copy;
+                # decoded back only for the checks and the status bar
+                data = memoryview(self._file_blob)[line_starts[line - 1]:line_starts[line] - 1]
+                line_content = str(data, 'utf-8')
+            else:
+                line_content = text.get(line_start, line_end)
+                data = line_content.encode('utf-8')
 
             if not line_content.strip():
                 return  # Skip empty lines
 
-            # Prepare data for sending
-            data = line_content
-
             # Add newline if option is selected
-            if self.newline_var.get():
-                data += '\r\n'
+            data = b''.join((data, self._crlf_suffix))
 
-            # Encode and send
-            data = data.encode('utf-8')
-            self.serial_port.write(data)
+            # Send, reporting in the status bar once done; long lines are shortened
+            preview = line_content if len(line_content) <= 40 else line_content[:40] + '...'
+            self._queue_tx(data, f"Sent line: {preview}", "Error sending line")
+            logger.info("Sent line to serial port: %s", line_content)
 
-            # Report in status bar
-            self.status_var.set(f"Sent line: {line_content[:40]}{'...' if len(line_content) > 40 else ''}")
-            logger.info(f"Sent line to serial port: {line_content}")
-
-            # Highlight the sent line (without auto-removal)
-            self.file_content_text.tag_remove("highlight", "1.0", tk.END)
-            self.file_content_text.tag_configure("highlight", background="lightblue")
-            self.file_content_text.tag_add("highlight", line_start, line_end)
+            # Highlight the sent line (without auto-removal); usually the click
+            # that started the double-click has highlighted it already
+            if line != self._highlight_line:
+                self._set_highlight(line)
 
         except Exception as e:
             error_msg = f"Error sending line: {str(e)}"
@@ -812,32 +1172,54 @@ class SerialGUI:
     def highlight_line(self, event=None):
         """Highlight the line that was clicked on"""
         try:
-            # Clear any existing highlights
-            self.file_content_text.tag_remove("highlight", "1.0", tk.END)
-
             # Get the current line based on cursor position
             index = self.file_content_text.index(f"@{event.x},{event.y}")
-            line_start = self.file_content_text.index(f"{index} linestart")
-            line_end = self.file_content_text.index(f"{index} lineend")
+            line = int(index.split('.', 1)[0])
+            if line == self._highlight_line:
+                return  # Already highlighted
 
-            # Highlight the clicked line
-            self.file_content_text.tag_configure("highlight", background="lightblue")
-            self.file_content_text.tag_add("highlight", line_start, line_end)
+            # Move the highlight to the clicked line
+            self._set_highlight(line)
 
-            # Make the clicked line visible (especially if scrolled out of view)
-            self.file_content_text.see(index)
+            # Make the clicked line visible if it's scrolled out of view; a clicked
+            # character is nearly always on screen, and bbox() is cheaper than see()
+            text = self.file_content_text
+            if text.bbox(index) is None:
+                text.see(index)
 
         except Exception as e:
-            logger.error(f"Error highlighting line: {str(e)}")
-
-    def update_port_tooltip(self, event=None):
-        """Update the tooltip for the port combo box with the current selection"""
-        current_port = self.port_combo.get()
-        if current_port:
-            self.port_tooltip.text = current_port
+            logger.error("Error highlighting line: %s", e)
+
+    def _ignore_file_edit_key(self, event):
+        """Ignore keys that would edit the file view, letting navigation and copying through"""
+        if event.keysym in self.FILE_VIEW_KEYS:
+            return None
+        # Control held (0x4), or Command on macOS (0x8)
+        if event.state & 0xC and event.keysym.lower() in self.FILE_VIEW_CONTROL_KEYS:
+            return None
+        return "break"
+
+    def _focus_next_widget(self, event):
+        """Move the focus from the file view to the next widget"""
+        event.widget.tk_focusNext().focus_set()
+        return "break"
+
+    def _focus_prev_widget(self, event):
+        """Move the focus from the file view to the previous widget"""
+        event.widget.tk_focusPrev().focus_set()
+        return "break"
+
+    def _set_highlight(self, line):
+        """Highlight a line of the file view, removing the highlight from the previous one"""
+        # Only the highlighted line carries the tag, so there's no need to search the whole text
+        previous = self._highlight_line
+        previous_range = (f"{previous}.0", f"{previous}.end") if previous is not None else ()
+        self.root.tk.call('py_highlight', str(self.file_content_text), f"{line}.0", f"{line}.end",
+                          *previous_range)
+        self._highlight_line = line
 
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = SerialGUI(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()